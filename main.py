@@ -5,19 +5,26 @@ Voice Recorder - Local voice-to-text with global hotkey.
 Press Cmd+Shift+Space to start/stop recording.
 """
 
+import logging
 import sys
+import queue
 import signal
 import threading
 import time
 from typing import Literal, Optional
+import numpy as np
 from voice_recorder.config import config
-from voice_recorder.state_manager import StateManager, RecordingState
-from voice_recorder.audio_recorder import AudioRecorder, is_silent
+from voice_recorder.state_manager import StateManager, RecordingState, RecordingStats
+from voice_recorder.audio_recorder import AudioRecorder
 from voice_recorder.transcriber import Transcriber
-from voice_recorder.text_injector import TextInjector
+from voice_recorder.text_injector import PasteResult, TextInjector
 from voice_recorder.hotkey_listener import HotkeyListener
 from voice_recorder.ui import VoiceRecorderUI
 
+logger = logging.getLogger("voice_recorder.app")
+
+_WHISPER_WINDOW_SECONDS = 30  # Whisper encodes audio in fixed 30-second windows
+
 
 class VoiceRecorderApp:
     """Main application class."""
@@ -27,122 +34,227 @@ class VoiceRecorderApp:
         self.state_manager = StateManager()
         self.transcriber = Transcriber()
         self.text_injector = TextInjector()
-        self.audio_recorder = AudioRecorder(on_audio_chunk=self._on_audio_chunk)
+        self.audio_recorder = AudioRecorder(on_audio_chunk=self.state_manager.add_audio_chunk)
         self.hotkey_listener = HotkeyListener(on_hotkey=self._on_hotkey_pressed)
         self.ui: VoiceRecorderUI | None = None
         self.running = True
+        self._shutdown_event = threading.Event()  # Set from the signal handler
         self.recording_source: Literal["hotkey", "ui_button"] = "hotkey"
 
         # Chunked transcription state
         self._chunked_transcription_thread: Optional[threading.Thread] = None
         self._stop_chunked_transcription = threading.Event()
+        self._chunk_worker_done = threading.Event()
         self._accumulated_transcription = ""
+        self._decoded_end = 0  # Sample index where the last transcribed chunk audio ended
         self._recording_start_time: float = 0.0
 
-    def _on_audio_chunk(self, chunk):
-        """Called when a new audio chunk is available."""
-        if self.state_manager.is_recording():
-            self.state_manager.add_audio_chunk(chunk)
+        # Persistent worker that processes finished recordings. The state manager
+        # double-buffers audio, so up to two recordings can be in flight at once
+        # (one being captured while the previous one is transcribed).
+        self._recording_slots = threading.Semaphore(2)
+        self._processing_queue: queue.Queue = queue.Queue()
+        self._processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
+        self._processing_thread.start()
+
+        # Model warmup state
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_done = threading.Event()
+
+    def _warmup_transcriber(self):
+        """Load the Whisper model and run a silent pass so the first recording doesn't stall."""
+        try:
+            logger.info("🔥 Warming up transcriber...")
+            self.transcriber.warmup()
+            logger.info("✅ Transcriber ready")
+        except Exception as e:
+            logger.warning("⚠️  Transcriber warmup failed: %s", e)
+        finally:
+            self._warmup_done.set()
+
+    def _start_input_services(self, require_hotkey: bool = False):
+        """
+        Open the audio stream and start the hotkey listener (runs alongside UI setup).
+
+        Args:
+            require_hotkey: Re-raise a hotkey listener failure instead of falling back to
+                the UI button (headless mode has no other way to record)
+        """
+        try:
+            # Keep the input stream open so recording starts without device-open latency
+            self.audio_recorder.open_stream()
+            logger.info("✅ Audio stream ready")
+        except Exception as e:
+            logger.error("❌ Could not open audio stream (will retry on first recording): %s", e)
+
+        try:
+            self.hotkey_listener.start()
+            logger.info("✅ Hotkey listener started")
+        except Exception as e:
+            if require_hotkey:
+                raise
+            logger.error("❌ Hotkey listener failed, only the UI button will work: %s", e)
+
+    def _wait_for_warmup(self):
+        """Block until warmup finishes so a recording made mid-warmup doesn't load the model twice."""
+        if self._warmup_thread is not None and not self._warmup_done.is_set():
+            logger.info("⏳ Waiting for transcriber warmup to finish...")
+            self._warmup_done.wait(timeout=60)
 
     def _on_hotkey_pressed(self):
         """Called when the hotkey is pressed."""
-        print("\n--- Hotkey pressed ---")
+        logger.info("--- Hotkey pressed ---")
         self.recording_source = "hotkey"
         self._toggle_recording()
 
     def _on_ui_record_pressed(self):
         """Called when the UI record button is pressed."""
-        print("\n--- UI Record button pressed ---")
+        logger.info("--- UI Record button pressed ---")
         self.recording_source = "ui_button"
         self._toggle_recording()
 
     def _on_ui_clear_pressed(self):
         """Called when the UI clear button is pressed."""
-        print("\n--- UI Clear button pressed ---")
+        logger.info("--- UI Clear button pressed ---")
         self.state_manager.clear_transcription()
         self.state_manager.clear_buffer()
-        self._update_ui_transcription("")
-
-        # Clean up any temporary files from chunked transcription
-        self.transcriber.cleanup_temp_files()
+        self._update_ui(transcription="")
 
         # Clear accumulated transcription
         self._accumulated_transcription = ""
 
-        print("✅ Text, temp files, and audio buffer cleared")
+        logger.info("✅ Text and audio buffer cleared")
 
     def _toggle_recording(self):
         """Toggle recording state."""
         if self.state_manager.is_idle():
-            # Start recording
-            if self.state_manager.transition_to(RecordingState.RECORDING):
-                self.state_manager.reset_chunk_tracking()
+            # Start recording, unless both buffers are still waiting on transcription
+            if not self._recording_slots.acquire(blocking=False):
+                logger.warning("⏳ Still processing previous recordings, please wait...")
+                return
+
+            if not self.state_manager.transition_to(RecordingState.RECORDING):
+                self._recording_slots.release()
+            else:
+                self.state_manager.clear_buffer()
                 self._accumulated_transcription = ""
+                self._decoded_end = 0
                 self._recording_start_time = time.time()
                 self.audio_recorder.start_recording()
-                print("🎤 Recording... (Press hotkey/button again to stop)")
-                self._update_ui_state("RECORDING")
+                logger.info("🎤 Recording... (Press hotkey/button again to stop)")
+                self._update_ui(state="RECORDING")
 
                 # Start chunked transcription for UI mode
                 if config.enable_chunked_transcription and self.recording_source == "ui_button":
                     self._stop_chunked_transcription.clear()
+                    self._chunk_worker_done.clear()
                     self._chunked_transcription_thread = threading.Thread(
                         target=self._chunked_transcription_worker,
                         daemon=True
                     )
                     self._chunked_transcription_thread.start()
-                    print("📊 Chunked transcription enabled")
+                    logger.info("📊 Chunked transcription enabled")
 
         elif self.state_manager.is_recording():
+            # Signal chunked transcription to stop, and wake the worker if it is waiting
+            # for audio (the final drain rarely reaches the sample count it waits for)
+            self._stop_chunked_transcription.set()
+
             # Stop recording and process
             self.audio_recorder.stop_recording()
+            self.state_manager.wake_waiters()
 
-            # Signal chunked transcription to stop
-            if self._chunked_transcription_thread and self._chunked_transcription_thread.is_alive():
-                self._stop_chunked_transcription.set()
+            # Check if we used chunked transcription
+            chunked = (
+                config.enable_chunked_transcription and
+                self.recording_source == "ui_button" and
+                self._chunked_transcription_thread is not None
+            )
 
             if self.state_manager.transition_to(RecordingState.PROCESSING):
-                self._update_ui_state("PROCESSING")
-                # Process in a separate thread to avoid blocking
-                threading.Thread(target=self._process_recording, daemon=True).start()
+                if chunked:
+                    # The final pass reads the live buffer, so stay in PROCESSING until done
+                    self._update_ui(state="PROCESSING")
+                    self._processing_queue.put((self.recording_source, True, None, None))
+                else:
+                    # Snapshot the finished recording and capture the next one into the
+                    # other buffer, so the user can record again while this one transcribes
+                    stats = self.state_manager.get_recording_stats()
+                    audio_data = self.state_manager.get_audio_data() if stats.num_samples else None
+                    self.state_manager.swap_buffers()
+                    self._processing_queue.put((self.recording_source, False, audio_data, stats))
+                    self.state_manager.transition_to(RecordingState.IDLE)
+                    self._update_ui(state="IDLE", status="Transcribing...", status_color="orange")
 
         elif self.state_manager.is_processing():
-            print("⏳ Still processing previous recording, please wait...")
+            logger.warning("⏳ Still processing previous recording, please wait...")
 
     def _chunked_transcription_worker(self):
         """Worker thread for chunked transcription during recording."""
-        print("🔄 Chunked transcription worker started")
+        logger.info("🔄 Chunked transcription worker started")
+        self._wait_for_warmup()
 
         chunk_size_samples = config.chunk_duration_seconds * config.sample_rate
         overlap_samples = config.chunk_overlap_seconds * config.sample_rate
+        inv_sr = 1.0 / config.sample_rate
+        get_processed = self.state_manager.get_processed_samples
+        get_total = self.state_manager.get_total_samples
+        # When behind, several chunks are decoded in one call; a single Whisper window
+        # costs the same encoder pass whether it holds one chunk or several
+        chunks_per_window = max(
+            1, (_WHISPER_WINDOW_SECONDS - config.chunk_overlap_seconds) // config.chunk_duration_seconds
+        )
+        max_window_samples = chunks_per_window * chunk_size_samples
         chunk_count = 0
 
         try:
             while not self._stop_chunked_transcription.is_set():
+                # If transcription has fallen far behind real time, skip ahead to the most
+                # recent window so latency doesn't keep growing over a long recording
+                backlog = get_total() - get_processed()
+                if backlog > 2 * max_window_samples:
+                    skip_samples = backlog - max_window_samples
+                    self.state_manager.mark_chunk_processed(skip_samples)
+                    logger.warning(
+                        "⚠️  Transcription fell behind, skipping %.1f seconds of audio",
+                        skip_samples * inv_sr
+                    )
+                    backlog = max_window_samples
+
+                # Catch up on as many whole chunks as fit in one window
+                window_samples = min(max(backlog // chunk_size_samples, 1), chunks_per_window) * chunk_size_samples
+
                 # Check if we have enough audio for a chunk
+                chunk_start = max(0, get_processed() - overlap_samples)  # Where get_next_chunk starts
                 chunk_audio = self.state_manager.get_next_chunk(
-                    chunk_size_samples=chunk_size_samples,
+                    chunk_size_samples=window_samples,
                     overlap_samples=overlap_samples
                 )
 
                 if chunk_audio is not None:
                     chunk_count += 1
-                    print(f"\n📦 Processing chunk #{chunk_count}...")
+                    logger.info("📦 Processing chunk #%d...", chunk_count)
 
                     # Calculate progress
-                    processed_seconds = self.state_manager.get_processed_samples() / config.sample_rate
-                    total_seconds = self.state_manager.get_total_samples() / config.sample_rate
+                    processed_seconds = get_processed() * inv_sr
+                    total_seconds = get_total() * inv_sr
 
                     # Update UI with progress
                     self._update_ui_progress(processed_seconds, total_seconds)
-                    self._update_ui_status(f"Transcribing chunk {chunk_count}...", "blue")
+                    self._update_ui(status=f"Transcribing chunk {chunk_count}...", status_color="blue")
+
+                    # Audio the previous chunk already transcribed is in the prompt as text;
+                    # only decode what comes after it
+                    audio_to_transcribe = chunk_audio
+                    if chunk_start < self._decoded_end < chunk_start + len(chunk_audio):
+                        audio_to_transcribe = chunk_audio[self._decoded_end - chunk_start:]
 
                     try:
                         # Transcribe chunk with context from previous chunks
                         chunk_text = self.transcriber.transcribe_chunk_with_context(
-                            audio_data=chunk_audio,
+                            audio_data=audio_to_transcribe,
                             previous_text=self._accumulated_transcription,
-                            progress_callback=lambda msg: print(f"  {msg}")
+                            progress_callback=logger.info
                         )
 
                         if chunk_text:
@@ -153,59 +265,96 @@ class VoiceRecorderApp:
                                 self._accumulated_transcription = chunk_text
 
                             # Update UI with accumulated text
-                            self._update_ui_transcription(self._accumulated_transcription)
-                            print(f"  ✅ Chunk #{chunk_count} complete: +{len(chunk_text)} chars")
+                            self._update_ui(transcription=self._accumulated_transcription)
+                            logger.info("  ✅ Chunk #%d complete: +%d chars", chunk_count, len(chunk_text))
 
                         # Mark chunk as processed (excluding overlap)
-                        samples_processed = chunk_size_samples
+                        samples_processed = window_samples
                         self.state_manager.mark_chunk_processed(samples_processed)
+                        self._decoded_end = chunk_start + len(chunk_audio)
 
                     except Exception as e:
-                        print(f"  ❌ Error transcribing chunk #{chunk_count}: {e}")
-                        self._update_ui_status(f"Error in chunk {chunk_count}", "orange")
+                        logger.error("  ❌ Error transcribing chunk #%d: %s", chunk_count, e)
+                        self._update_ui(status=f"Error in chunk {chunk_count}", status_color="orange")
                         # Continue with next chunk despite error
 
                 else:
-                    # No chunk available yet, wait a bit
-                    time.sleep(1.0)
+                    # No chunk available yet, wait until one is. A full chunk or a stop
+                    # request wakes this immediately; the timeout is only a safety net.
+                    needed = get_processed() + chunk_size_samples
+                    self.state_manager.wait_for_samples(needed, timeout=0.1)
 
-            print("🛑 Chunked transcription worker stopping...")
+            logger.info("🛑 Chunked transcription worker stopping...")
 
         except Exception as e:
-            print(f"❌ Fatal error in chunked transcription worker: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Fatal error in chunked transcription worker: %s", e)
+
+        finally:
+            self._chunk_worker_done.set()
+
+    def _processing_loop(self):
+        """Worker thread that processes recordings handed off by _toggle_recording."""
+        while self.running:
+            job = self._processing_queue.get()
+            if job is None:
+                break
+            self._process_recording(*job)
+
+    def _process_recording(
+        self,
+        source: Literal["hotkey", "ui_button"],
+        chunked: bool,
+        audio_data: Optional[np.ndarray],
+        stats: Optional[RecordingStats],
+    ):
+        """
+        Process a finished recording.
+
+        Args:
+            source: What started the recording ("hotkey" or "ui_button")
+            chunked: Whether chunked transcription ran during the recording
+            audio_data: Snapshot of the recording (None for chunked recordings)
+            stats: Recording stats (None for chunked recordings)
+        """
+        sr = config.sample_rate
+        min_dur = config.min_recording_duration
+        enable_vad = config.enable_silence_detection
+
+        # Final status, shown together with the return to IDLE
+        status: Optional[str] = None
+        status_color = "gray"
 
-    def _process_recording(self):
-        """Process the recorded audio."""
         try:
-            # Check if we used chunked transcription
-            used_chunked_transcription = (
-                config.enable_chunked_transcription and
-                self.recording_source == "ui_button" and
-                self._chunked_transcription_thread is not None
-            )
+            self._wait_for_warmup()
 
-            if used_chunked_transcription:
-                # Wait for chunked transcription thread to finish
-                print("⏳ Waiting for chunked transcription to complete...")
-                if self._chunked_transcription_thread.is_alive():
-                    self._chunked_transcription_thread.join(timeout=10)
+            if chunked:
+                # Wait for chunked transcription thread to finish. No timeout: a batched
+                # window can take longer than any fixed bound on CPU, and the final pass
+                # must not run while the worker still appends text and marks progress.
+                logger.info("⏳ Waiting for chunked transcription to complete...")
+                self._chunk_worker_done.wait()
 
                 # Process any remaining audio (final pass)
-                print("🔄 Processing remaining audio...")
-                overlap_samples = config.chunk_overlap_seconds * config.sample_rate
+                logger.info("🔄 Processing remaining audio...")
+                overlap_samples = config.chunk_overlap_seconds * sr
                 remaining_audio = self.state_manager.get_remaining_audio(overlap_samples=overlap_samples)
 
+                # Like the live chunks, skip audio the worker already transcribed
+                if remaining_audio is not None:
+                    remaining_start = self.state_manager.get_total_samples() - len(remaining_audio)
+                    if self._decoded_end > remaining_start:
+                        remaining_audio = remaining_audio[self._decoded_end - remaining_start:]
+
                 if remaining_audio is not None and len(remaining_audio) > 0:
-                    duration = len(remaining_audio) / config.sample_rate
-                    print(f"📦 Final chunk: {duration:.2f}s")
+                    duration = len(remaining_audio) / sr
+                    logger.info("📦 Final chunk: %.2fs", duration)
 
                     try:
                         final_text = self.transcriber.transcribe_chunk_with_context(
                             audio_data=remaining_audio,
                             previous_text=self._accumulated_transcription,
-                            progress_callback=lambda msg: print(f"  {msg}")
+                            progress_callback=logger.info,
+                            beam_size=5,  # Last chunk, the user is waiting on accuracy not latency
                         )
 
                         if final_text:
@@ -214,158 +363,175 @@ class VoiceRecorderApp:
                             else:
                                 self._accumulated_transcription = final_text
 
-                            self._update_ui_transcription(self._accumulated_transcription)
-                            print(f"  ✅ Final chunk complete: +{len(final_text)} chars")
+                            self._update_ui(transcription=self._accumulated_transcription)
+                            logger.info("  ✅ Final chunk complete: +%d chars", len(final_text))
 
                     except Exception as e:
-                        print(f"  ⚠️  Error processing final chunk: {e}")
+                        logger.warning("  ⚠️  Error processing final chunk: %s", e)
 
                 # Use accumulated transcription
                 text = self._accumulated_transcription
 
-                # Cleanup temp files and clear buffer
-                self.transcriber.cleanup_temp_files()
-                self.state_manager.clear_buffer()
-
             else:
                 # Traditional single-pass transcription (for hotkey mode or if chunking disabled)
-                audio_data = self.state_manager.get_audio_data()
-
-                if audio_data is None or len(audio_data) == 0:
-                    print("⚠️  No audio data recorded")
-                    self.state_manager.transition_to(RecordingState.IDLE)
-                    self._update_ui_state("IDLE")
-                    self._update_ui_status("No audio data recorded", "orange")
+                if stats.num_samples == 0:
+                    logger.warning("⚠️  No audio data recorded")
+                    status, status_color = "No audio data recorded", "orange"
                     return
 
-                # Check duration
-                duration = len(audio_data) / config.sample_rate
-                print(f"📊 Recorded {duration:.2f} seconds of audio")
+                # Check duration (from counters; the audio itself isn't touched until transcription)
+                logger.info("📊 Recorded %.2f seconds of audio (rms %.4f, peak %.3f)", stats.duration, stats.rms, stats.peak)
 
-                if duration < config.min_recording_duration:
-                    print(f"⚠️  Recording too short (< {config.min_recording_duration}s)")
-                    self.state_manager.transition_to(RecordingState.IDLE)
-                    self._update_ui_state("IDLE")
-                    self._update_ui_status("Recording too short", "orange")
+                if stats.duration < min_dur:
+                    logger.warning("⚠️  Recording too short (< %ss)", min_dur)
+                    status, status_color = "Recording too short", "orange"
                     return
 
                 # Check if silent
-                if config.enable_silence_detection and is_silent(audio_data):
-                    print("⚠️  No speech detected (audio is silent)")
-                    self.state_manager.transition_to(RecordingState.IDLE)
-                    self._update_ui_state("IDLE")
-                    self._update_ui_status("No speech detected", "orange")
+                if enable_vad and stats.rms < config.energy_threshold:
+                    logger.warning("⚠️  No speech detected (audio is silent)")
+                    status, status_color = "No speech detected", "orange"
                     return
 
                 # Transcribe
-                print("🔄 Transcribing...")
+                logger.info("🔄 Transcribing...")
                 text = self.transcriber.transcribe(audio_data)
 
             # Common validation and output handling
             if not text:
-                print("⚠️  No text transcribed")
-                self.state_manager.transition_to(RecordingState.IDLE)
-                self._update_ui_state("IDLE")
-                self._update_ui_status("No text transcribed", "orange")
+                logger.warning("⚠️  No text transcribed")
+                status, status_color = "No text transcribed", "orange"
                 return
 
-            print(f"✅ Transcribed: \"{text[:100]}{'...' if len(text) > 100 else ''}\"")
-            print(f"   Total: {len(text)} characters")
+            logger.info("✅ Transcribed: \"%s%s\" (%d characters)", text[:100], "..." if len(text) > 100 else "", len(text))
 
             # Store transcription
             self.state_manager.set_last_transcription(text)
 
             # Handle based on recording source
-            if self.recording_source == "hotkey":
+            if source == "hotkey":
                 # Auto-insert mode (existing behavior)
-                print("📋 Pasting text...")
-                if self.text_injector.paste_text(text):
-                    print("✅ Text pasted successfully!")
-                    self._update_ui_status("Text pasted!", "green")
+                logger.info("📋 Pasting text...")
+                result = self.text_injector.paste_text(text)
+                if result is PasteResult.PASTED:
+                    logger.info("✅ Text pasted successfully!")
+                    status, status_color = "Text pasted!", "green"
+                elif result is PasteResult.COPIED:
+                    # paste_text copies before pasting, so the text is already on the clipboard
+                    logger.warning("⚠️  Failed to paste text (copied to clipboard instead)")
+                    status, status_color = "Copied to clipboard", "orange"
                 else:
-                    print("⚠️  Failed to paste text (copied to clipboard instead)")
-                    self.text_injector.copy_to_clipboard_only(text)
-                    self._update_ui_status("Copied to clipboard", "orange")
+                    logger.error("❌ Failed to copy text to clipboard")
+                    status, status_color = "Error: could not copy text", "red"
             else:
                 # UI display mode
-                print("📱 Displaying in UI...")
-                self._update_ui_transcription(text)
-                self._update_ui_status("Transcription complete!", "green")
-                print("✅ Text displayed in UI")
+                logger.info("📱 Displaying in UI...")
+                self._update_ui(transcription=text)
+                status, status_color = "Transcription complete!", "green"
+                logger.info("✅ Text displayed in UI")
 
         except Exception as e:
-            print(f"❌ Error processing recording: {e}")
-            import traceback
-            traceback.print_exc()
-            self._update_ui_status(f"Error: {str(e)}", "red")
+            logger.exception("❌ Error processing recording: %s", e)
+            status, status_color = f"Error: {str(e)}", "red"
 
         finally:
-            # Cleanup and return to idle state
-            self.transcriber.cleanup_temp_files()
-            self.state_manager.clear_buffer()
-            self.state_manager.transition_to(RecordingState.IDLE)
-            self._update_ui_state("IDLE")
-            self._accumulated_transcription = ""
-            print("Ready for next recording")
-
-    def _update_ui_state(self, state: str):
-        """Update UI state (thread-safe)."""
-        if self.ui:
-            self.ui.queue_state_update(state)
-
-    def _update_ui_transcription(self, text: str):
-        """Update UI transcription (thread-safe)."""
-        if self.ui:
-            self.ui.queue_transcription_update(text)
-
-    def _update_ui_status(self, message: str, color: str = "gray"):
-        """Update UI status message (thread-safe)."""
+            # Chunked recordings held the live buffer; release it and return to idle.
+            # Snapshotted recordings already went idle when they were handed off.
+            if chunked:
+                self.state_manager.clear_buffer()
+                self.state_manager.transition_to(RecordingState.IDLE)
+                self._update_ui(state="IDLE", status=status, status_color=status_color)
+                self._accumulated_transcription = ""
+            elif status is not None and not self.state_manager.is_recording():
+                # A newer recording already started: keep its "Recording..." status
+                self._update_ui(status=status, status_color=status_color)
+            self._recording_slots.release()
+            logger.info("Ready for next recording")
+
+    def _update_ui(
+        self,
+        state: Optional[str] = None,
+        status: Optional[str] = None,
+        status_color: str = "gray",
+        transcription: Optional[str] = None,
+    ):
+        """Queue state, status and transcription changes as a single UI update (thread-safe)."""
         if self.ui:
-            self.ui.queue_status_update(message, color)
+            self.ui.queue_update(
+                state=state,
+                status=status,
+                status_color=status_color,
+                transcription=transcription,
+            )
 
     def _update_ui_progress(self, processed_seconds: float, total_seconds: float):
         """Update UI progress (thread-safe)."""
         if self.ui:
             self.ui.queue_progress_update(processed_seconds, total_seconds)
 
+    def _print_banner(self):
+        """Print the startup banner in a single write (skipped when not on a terminal)."""
+        if not sys.stdout.isatty() and not config.verbose:
+            return
+
+        lines = [
+            "=" * 60,
+            "Voice Recorder - Local Voice-to-Text",
+            "=" * 60,
+            "\n📝 Configuration:",
+            f"  Model: {config.whisper_model}",
+            f"  Hotkey: {config.hotkey}",
+            f"  Sample rate: {config.sample_rate}Hz",
+            f"  Max duration: {config.max_recording_duration}s",
+            f"\n⌨️  Press {config.hotkey_display} to record and auto-insert",
+        ]
+        if config.ui_enabled:
+            lines.append("🖱️  Use UI button to record and display in window")
+            lines.append("⌨️  Close window to quit\n")
+        else:
+            lines.append("⌨️  Press Ctrl+C to quit\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def run(self):
         """Run the application."""
-        print("=" * 60)
-        print("Voice Recorder - Local Voice-to-Text")
-        print("=" * 60)
-        print(f"\n📝 Configuration:")
-        print(f"  Model: {config.whisper_model}")
-        print(f"  Hotkey: {config.hotkey}")
-        print(f"  Sample rate: {config.sample_rate}Hz")
-        print(f"  Max duration: {config.max_recording_duration}s")
-        print(f"\n⌨️  Press {config.hotkey.replace('<', '').replace('>', '').replace('cmd', 'Cmd').replace('alt', 'Option').replace('shift', 'Shift').replace('+', '+')} to record and auto-insert")
-        print("🖱️  Use UI button to record and display in window")
-        print("⌨️  Close window to quit\n")
+        self._print_banner()
 
         # Set up signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
 
         try:
-            # Start hotkey listener in background thread (non-blocking)
-            self.hotkey_listener.start()
-            print("✅ Hotkey listener started")
+            # Warm up the model in the background
+            self._warmup_thread = threading.Thread(target=self._warmup_transcriber, daemon=True)
+            self._warmup_thread.start()
+
+            if not config.ui_enabled:
+                # Headless: hotkey-only, block until interrupted
+                self._start_input_services(require_hotkey=True)
+                while not self._shutdown_event.wait(timeout=0.5):
+                    pass
+                logger.info("Shutting down gracefully...")
+                return 0
+
+            # Open the audio stream and start the hotkey listener while the UI comes up
+            threading.Thread(target=self._start_input_services, daemon=True).start()
 
             # Create and show UI (blocking - runs in main thread)
             self.ui = VoiceRecorderUI(
                 on_record_pressed=self._on_ui_record_pressed,
-                on_clear_pressed=self._on_ui_clear_pressed
+                on_clear_pressed=self._on_ui_clear_pressed,
+                shutdown_event=self._shutdown_event,
             )
-            print("✅ UI initialized\n")
+            logger.info("✅ UI initialized")
 
             # Start UI main loop (blocks until window closes)
             self.ui.show()
 
         except KeyboardInterrupt:
-            print("\n\nShutting down...")
+            logger.info("Shutting down...")
         except Exception as e:
-            print(f"\n❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error: %s", e)
             return 1
         finally:
             self.shutdown()
@@ -373,27 +539,41 @@ class VoiceRecorderApp:
         return 0
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals."""
-        print("\n\nShutting down gracefully...")
-        self.shutdown()
-        sys.exit(0)
+        """
+        Handle shutdown signals.
+
+        Only sets a flag: tearing down Tk or the audio stream from inside a signal
+        frame can deadlock. The UI loop (or the headless wait) notices the flag and
+        exits normally, and run() cleans up in its finally block.
+        """
+        self._shutdown_event.set()
 
     def shutdown(self):
         """Clean up resources."""
         self.running = False
-        if self.audio_recorder.is_recording:
-            self.audio_recorder.stop_recording()
+        self._processing_queue.put(None)
+        self.audio_recorder.close_stream()
         self.hotkey_listener.stop()
         if self.ui:
             try:
                 self.ui.destroy()
             except Exception:
                 pass  # UI might already be destroyed
-        print("Goodbye!")
+        logger.info("Goodbye!")
+
+
+def _configure_logging():
+    """Log to stderr: everything when VERBOSE is set, otherwise only warnings and errors."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger = logging.getLogger("voice_recorder")
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO if config.verbose else logging.WARNING)
 
 
 def main():
     """Main entry point."""
+    _configure_logging()
     app = VoiceRecorderApp()
     return app.run()
 
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Convert a Whisper checkpoint to a CTranslate2 model with int8 weights.
+
+The result is written to MODEL_CACHE_DIR/<model>-int8, where the transcriber picks
+it up in place of downloading the float16 model and quantizing it on every load.
+
+Requires the converter extras, which the app itself does not need:
+
+    uv pip install transformers torch
+    uv run python scripts/quantize_model.py --model base.en
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ctranslate2.converters import TransformersConverter  # noqa: E402
+from voice_recorder.config import config  # noqa: E402
+
+
+def main() -> int:
+    """Run the conversion."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=config.whisper_model, help="Whisper model name (default: WHISPER_MODEL)")
+    parser.add_argument("--source", help="Hugging Face checkpoint (default: openai/whisper-<model>)")
+    args = parser.parse_args()
+
+    source = args.source or f"openai/whisper-{args.model}"
+    output_dir = config.model_cache_dir / f"{args.model}-int8"
+
+    print(f"Converting {source} -> {output_dir} (int8)...")
+    converter = TransformersConverter(source, copy_files=["tokenizer.json", "preprocessor_config.json"])
+    converter.convert(str(output_dir), quantization="int8", force=True)
+    print("Done. The transcriber will load this model next time it starts.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
 """Voice Recorder - Local voice-to-text with global hotkey."""
 
+import logging
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = "0.1.0"
@@ -1,10 +1,20 @@
 """Audio recording functionality."""
 
+import collections
+import ctypes
+import logging
+import os
+import sys
+import threading
 import numpy as np
 import sounddevice as sd
 from typing import Optional, Callable
 from .config import config
 
+logger = logging.getLogger(__name__)
+
+_MIN_DRAIN_FRAMES = 512  # Consumer thread wakes at most once per this many frames
+
 
 class AudioRecorder:
     """Records audio from the microphone."""
@@ -14,105 +24,239 @@ class AudioRecorder:
         Initialize audio recorder.
 
         Args:
-            on_audio_chunk: Callback function called for each audio chunk
+            on_audio_chunk: Callback function called for each mono audio chunk. The chunk
+                is a view into the ring buffer and must be copied before returning.
+                Called from a consumer thread, never from the realtime audio thread.
         """
         self.on_audio_chunk = on_audio_chunk
         self.stream: Optional[sd.InputStream] = None
-        self._is_recording = False
+        self.capturing = False
+        self._priority_elevated = False
+        self._stream_lock = threading.Lock()  # Stream may be opened at startup and on first recording
+
+        # Single-producer/single-consumer ring between the audio callback and the consumer
+        # thread. Indices grow monotonically; only the callback advances _write_index and
+        # only the consumer advances _read_index, so neither side needs a lock.
+        self._ring_size = config.sample_rate * 8
+        self._mono = config.channels == 1
+        self._ring = np.empty(self._ring_size, dtype=np.float32)
+        self._write_index = 0
+        self._read_index = 0
+        self._overruns = 0
+        self._status_ring: collections.deque = collections.deque(maxlen=16)  # Logged by the consumer
+        self._drain_lock = threading.Lock()  # Consumer thread vs. final drain in stop_recording
+        self._consumer_thread: Optional[threading.Thread] = None
+        self._consumer_stop = threading.Event()
+
+    def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
+        """Callback function for audio stream. Runs on the realtime thread: no locks, no allocation."""
+        if not self._priority_elevated:
+            self._priority_elevated = True
+            _elevate_thread_priority(frames / config.sample_rate)
+
+        if not self.capturing:
+            return
+
+        if status:
+            # Logging takes locks; leave it to the consumer thread
+            self._status_ring.append(status)
+
+        write_index = self._write_index
+        if write_index - self._read_index + frames > self._ring_size:
+            # Consumer fell too far behind; drop this block rather than overwrite unread audio
+            self._overruns += 1
+            return
+
+        # Mono input is already a contiguous float32 buffer: view it flat instead of
+        # slicing out a strided column
+        samples = np.frombuffer(indata, dtype=np.float32, count=frames) if self._mono else indata[:, 0]
+
+        start = write_index % self._ring_size
+        end = start + frames
+        if end <= self._ring_size:
+            np.copyto(self._ring[start:end], samples)
+        else:
+            split = self._ring_size - start
+            np.copyto(self._ring[start:], samples[:split])
+            np.copyto(self._ring[:end - self._ring_size], samples[split:])
+
+        # Publish only after the samples are in place
+        self._write_index = write_index + frames
+
+    def _drain(self) -> None:
+        """Deliver everything written to the ring since the last drain to on_audio_chunk."""
+        with self._drain_lock:
+            while self._status_ring:
+                logger.warning("Audio status: %s", self._status_ring.popleft())
+
+            if self._overruns:
+                logger.warning("Audio ring buffer overrun, dropped %d block(s)", self._overruns)
+                self._overruns = 0
+
+            read_index = self._read_index
+            available = self._write_index - read_index
+            if available <= 0:
+                return
+
+            if self.on_audio_chunk:
+                start = read_index % self._ring_size
+                end = start + available
+                if end <= self._ring_size:
+                    self.on_audio_chunk(self._ring[start:end])
+                else:
+                    self.on_audio_chunk(self._ring[start:])
+                    self.on_audio_chunk(self._ring[:end - self._ring_size])
+
+            self._read_index = read_index + available
+
+    def _consumer_loop(self) -> None:
+        """Drain the ring roughly once per audio block until the stream is closed."""
+        # AUDIO_BLOCKSIZE=0 lets the backend pick the block size, so don't derive a zero period from it
+        period = max(config.audio_blocksize, _MIN_DRAIN_FRAMES) / config.sample_rate
+        while not self._consumer_stop.wait(period):
+            try:
+                self._drain()
+            except Exception as e:
+                logger.error("Error delivering audio chunk: %s", e)
+
+    def open_stream(self) -> None:
+        """Open the input stream and keep it running so recording starts instantly."""
+        with self._stream_lock:
+            if self.stream is not None:
+                return
+
+            logger.info("Opening audio stream at %dHz...", config.sample_rate)
+
+            try:
+                self.stream = sd.InputStream(
+                    samplerate=config.sample_rate,
+                    channels=config.channels,
+                    dtype=np.float32,
+                    blocksize=config.audio_blocksize,
+                    callback=self._audio_callback,
+                )
+                self.stream.start()
+                logger.info("Audio stream opened")
+            except Exception as e:
+                self.stream = None
+                logger.error("Error opening audio stream: %s", e)
+                raise
+
+            self._consumer_stop.clear()
+            self._consumer_thread = threading.Thread(target=self._consumer_loop, daemon=True)
+            self._consumer_thread.start()
+
+    def close_stream(self) -> None:
+        """Stop and close the input stream."""
+        self.capturing = False
+
+        with self._stream_lock:
+            if self.stream:
+                self.stream.stop()
+                self.stream.close()
+                self.stream = None
+                logger.info("Audio stream closed")
+
+            if self._consumer_thread is not None:
+                self._consumer_stop.set()
+                self._consumer_thread.join(timeout=1.0)
+                self._consumer_thread = None
 
     def start_recording(self) -> None:
         """Start recording audio."""
-        if self._is_recording:
-            print("Already recording")
+        if self.capturing:
+            logger.warning("Already recording")
             return
 
-        print(f"Starting audio recording at {config.sample_rate}Hz...")
+        # Normally opened at startup; open lazily if it wasn't
+        self.open_stream()
 
-        def audio_callback(indata: np.ndarray, frames: int, time_info, status):
-            """Callback function for audio stream."""
-            if status:
-                print(f"Audio status: {status}")
+        # Discard anything a late callback wrote after the previous recording stopped
+        with self._drain_lock:
+            self._read_index = self._write_index
 
-            # Copy the audio data and send to callback
-            if self.on_audio_chunk:
-                # Convert to 1D array and copy
-                audio_chunk = indata[:, 0].copy() if config.channels == 1 else indata.copy()
-                self.on_audio_chunk(audio_chunk)
-
-        try:
-            self.stream = sd.InputStream(
-                samplerate=config.sample_rate,
-                channels=config.channels,
-                dtype=np.float32,
-                callback=audio_callback,
-            )
-            self.stream.start()
-            self._is_recording = True
-            print("Recording started")
-        except Exception as e:
-            print(f"Error starting recording: {e}")
-            raise
+        self.capturing = True
+        logger.info("Recording started")
 
     def stop_recording(self) -> None:
-        """Stop recording audio."""
-        if not self._is_recording:
-            print("Not currently recording")
+        """Stop recording audio (the stream stays open)."""
+        if not self.capturing:
+            logger.warning("Not currently recording")
             return
 
-        print("Stopping audio recording...")
+        self.capturing = False
 
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
-
-        self._is_recording = False
-        print("Recording stopped")
+        # Deliver the tail now so the caller sees the complete recording
+        self._drain()
+        logger.info("Recording stopped")
 
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self._is_recording
+        return self.capturing
 
     def __del__(self):
         """Cleanup when object is destroyed."""
-        if self._is_recording:
-            self.stop_recording()
-
-
-def check_audio_devices() -> None:
-    """Print available audio devices."""
-    print("\nAvailable audio devices:")
-    print(sd.query_devices())
-    print(f"\nDefault input device: {sd.query_devices(kind='input')['name']}")
+        self.close_stream()
 
 
-def calculate_energy(audio_data: np.ndarray) -> float:
+def _elevate_thread_priority(period_seconds: float) -> None:
     """
-    Calculate RMS energy of audio data.
+    Best-effort realtime scheduling for the calling (audio callback) thread.
 
     Args:
-        audio_data: Audio samples as numpy array
-
-    Returns:
-        RMS energy value
+        period_seconds: Duration of one audio block, used as the scheduling period on macOS
     """
-    return float(np.sqrt(np.mean(audio_data**2)))
+    try:
+        if sys.platform == "darwin":
+            libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
 
+            class TimebaseInfo(ctypes.Structure):
+                _fields_ = [("numer", ctypes.c_uint32), ("denom", ctypes.c_uint32)]
 
-def is_silent(audio_data: np.ndarray, threshold: Optional[float] = None) -> bool:
-    """
-    Check if audio is silent based on energy threshold.
+            class TimeConstraintPolicy(ctypes.Structure):
+                _fields_ = [
+                    ("period", ctypes.c_uint32),
+                    ("computation", ctypes.c_uint32),
+                    ("constraint", ctypes.c_uint32),
+                    ("preemptible", ctypes.c_int),
+                ]
 
-    Args:
-        audio_data: Audio samples as numpy array
-        threshold: Energy threshold (uses config default if not provided)
+            timebase = TimebaseInfo()
+            libc.mach_timebase_info(ctypes.byref(timebase))
+            ns_to_abs = timebase.denom / timebase.numer
+            period = int(period_seconds * 1e9 * ns_to_abs)
+            policy = TimeConstraintPolicy(period, period // 4, period // 2, 1)
 
-    Returns:
-        True if audio is silent, False otherwise
-    """
-    if threshold is None:
-        threshold = config.energy_threshold
+            libc.pthread_self.restype = ctypes.c_void_p
+            libc.pthread_mach_thread_np.argtypes = [ctypes.c_void_p]
+            libc.pthread_mach_thread_np.restype = ctypes.c_uint32
+            thread = libc.pthread_mach_thread_np(libc.pthread_self())
+
+            THREAD_TIME_CONSTRAINT_POLICY = 2
+            THREAD_TIME_CONSTRAINT_POLICY_COUNT = 4
+            result = libc.thread_policy_set(
+                thread,
+                THREAD_TIME_CONSTRAINT_POLICY,
+                ctypes.byref(policy),
+                THREAD_TIME_CONSTRAINT_POLICY_COUNT,
+            )
+            if result != 0:
+                raise OSError(f"thread_policy_set returned {result}")
+        elif sys.platform.startswith("linux"):
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(80))
+        elif sys.platform == "win32":
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL):
+                raise ctypes.WinError()
+    except Exception as e:
+        logger.warning("Could not raise audio thread priority: %s", e)
+
+
+def check_audio_devices() -> None:
+    """Print available audio devices."""
+    print("\nAvailable audio devices:")
+    print(sd.query_devices())
+    print(f"\nDefault input device: {sd.query_devices(kind='input')['name']}")
 
-    energy = calculate_energy(audio_data)
-    return energy < threshold
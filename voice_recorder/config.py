@@ -1,26 +1,33 @@
 """Configuration management for voice recorder."""
 
 import os
-import tempfile
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+_HOTKEY_MAP = {"<": "", ">": "", "cmd": "Cmd", "alt": "Option", "shift": "Shift"}
+_HOTKEY_RE = re.compile(r"<|>|cmd|alt|shift")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """Application configuration (read-only once loaded)."""
 
     # Whisper settings
     whisper_model: str = os.getenv("WHISPER_MODEL", "base.en")
-    whisper_device: str = os.getenv("WHISPER_DEVICE", "cpu")
+    whisper_device: str = os.getenv("WHISPER_DEVICE", "auto")  # auto = cuda if available, else cpu
+    whisper_compute_type: str = os.getenv("WHISPER_COMPUTE_TYPE", "")  # Empty = best int8 variant the device supports
+    whisper_cpu_threads: int = int(os.getenv("WHISPER_CPU_THREADS", "0"))  # 0 = half the available cores
+    model_cache_dir: Path = Path(os.getenv("MODEL_CACHE_DIR", "~/.cache/voice-recorder")).expanduser()  # Pre-quantized models
 
     # Audio settings
     sample_rate: int = int(os.getenv("SAMPLE_RATE", "16000"))
     channels: int = int(os.getenv("CHANNELS", "1"))
+    audio_blocksize: int = int(os.getenv("AUDIO_BLOCKSIZE", "512"))  # Frames per callback (32ms at 16kHz)
 
     # Recording settings
     max_recording_duration: int = int(os.getenv("MAX_RECORDING_DURATION", "3600"))  # 1 hour (increased from 5 minutes)
@@ -30,7 +37,6 @@ class Config:
     enable_chunked_transcription: bool = os.getenv("ENABLE_CHUNKED_TRANSCRIPTION", "true").lower() == "true"
     chunk_duration_seconds: int = int(os.getenv("CHUNK_DURATION_SECONDS", "5"))  # Process in 5-second chunks
     chunk_overlap_seconds: int = int(os.getenv("CHUNK_OVERLAP_SECONDS", "3"))  # 3-second overlap for context
-    temp_audio_dir: Path = Path(os.getenv("TEMP_AUDIO_DIR", tempfile.gettempdir())) / "voice_recorder_chunks"
 
     # Silence detection
     enable_silence_detection: bool = os.getenv("ENABLE_SILENCE_DETECTION", "true").lower() == "true"
@@ -42,15 +48,33 @@ class Config:
 
     # Hotkey
     hotkey: str = os.getenv("HOTKEY", "<cmd>+<alt>+<space>")
+    hotkey_display: str = field(init=False)  # e.g. 'Cmd+Option+space', derived from hotkey
+
+    # UI (disable to run headless with the hotkey only)
+    ui_enabled: bool = os.getenv("UI_ENABLED", "true").lower() == "true"
+
+    # Logging (warnings and errors are always shown)
+    verbose: bool = os.getenv("VERBOSE", "false").lower() == "true"
 
     def __post_init__(self):
         """Validate configuration."""
-        if self.sample_rate not in [8000, 16000, 22050, 44100, 48000]:
-            raise ValueError(f"Invalid sample rate: {self.sample_rate}")
+        # Whisper consumes 16kHz audio as-is. Capturing at that rate makes the audio
+        # backend resample on the capture thread, so nothing has to after recording.
+        if self.sample_rate != 16000:
+            raise ValueError(f"Invalid sample rate: {self.sample_rate} (Whisper requires 16000)")
 
         if self.channels not in [1, 2]:
             raise ValueError(f"Invalid number of channels: {self.channels}")
 
+        if self.whisper_device not in ["auto", "cpu", "cuda"]:
+            raise ValueError(f"Invalid Whisper device: {self.whisper_device}")
+
+        if self.whisper_cpu_threads < 0:
+            raise ValueError("Whisper CPU threads must be non-negative")
+
+        if self.audio_blocksize < 0:
+            raise ValueError("Audio blocksize must be non-negative")
+
         if self.max_recording_duration <= 0:
             raise ValueError("Max recording duration must be positive")
 
@@ -66,8 +90,10 @@ class Config:
         if self.chunk_overlap_seconds >= self.chunk_duration_seconds:
             raise ValueError("Chunk overlap must be less than chunk duration")
 
-        # Create temp directory if it doesn't exist
-        self.temp_audio_dir.mkdir(parents=True, exist_ok=True)
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(
+            self, "hotkey_display", _HOTKEY_RE.sub(lambda m: _HOTKEY_MAP[m.group(0)], self.hotkey)
+        )
 
 
 # Global config instance
@@ -1,9 +1,12 @@
 """Global hotkey listener."""
 
+import logging
 from typing import Callable
 from pynput import keyboard
 from .config import config
 
+logger = logging.getLogger(__name__)
+
 
 class HotkeyListener:
     """Listens for global hotkey presses."""
@@ -20,19 +23,21 @@ class HotkeyListener:
 
     def start(self) -> None:
         """Start listening for hotkeys."""
-        print(f"Setting up hotkey: {config.hotkey}")
-        print(f"Press {config.hotkey} to start/stop recording")
+        logger.info("Setting up hotkey: %s", config.hotkey)
 
         try:
             # Create listener with global hotkeys
             self.listener = keyboard.GlobalHotKeys({config.hotkey: self.on_hotkey})
             self.listener.start()
-            print("Hotkey listener started successfully")
+            logger.info("Hotkey listener started successfully")
         except Exception as e:
-            print(f"Error starting hotkey listener: {e}")
-            print("\nNote: This requires Accessibility permissions.")
-            print("Go to: System Settings → Privacy & Security → Accessibility")
-            print("Add Terminal or your Python executable to the list.")
+            logger.error(
+                "Error starting hotkey listener: %s\n"
+                "Note: This requires Accessibility permissions.\n"
+                "Go to: System Settings → Privacy & Security → Accessibility\n"
+                "Add Terminal or your Python executable to the list.",
+                e,
+            )
             raise
 
     def stop(self) -> None:
@@ -40,7 +45,7 @@ class HotkeyListener:
         if self.listener:
             self.listener.stop()
             self.listener = None
-            print("Hotkey listener stopped")
+            logger.info("Hotkey listener stopped")
 
     def wait(self) -> None:
         """Wait for the listener to finish (blocking)."""
@@ -1,9 +1,14 @@
 """State management for recording sessions."""
 
+import logging
 import threading
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
 import numpy as np
+from .config import config
+
+logger = logging.getLogger(__name__)
 
 
 class RecordingState(Enum):
@@ -14,22 +19,53 @@ class RecordingState(Enum):
     PROCESSING = auto()
 
 
+@dataclass(frozen=True)
+class RecordingStats:
+    """Summary of a recording, maintained incrementally as audio arrives."""
+
+    num_samples: int
+    duration: float
+    rms: float
+    peak: float
+
+
 class StateManager:
     """Thread-safe state management for recording sessions."""
 
+    _VALID_TRANSITIONS: dict[RecordingState, frozenset[RecordingState]] = {
+        RecordingState.IDLE: frozenset({RecordingState.RECORDING}),
+        RecordingState.RECORDING: frozenset({RecordingState.PROCESSING, RecordingState.IDLE}),
+        RecordingState.PROCESSING: frozenset({RecordingState.IDLE}),
+    }
+
     def __init__(self):
         """Initialize state manager."""
         self._state = RecordingState.IDLE
         self._lock = threading.Lock()
-        self._audio_buffer: list[np.ndarray] = []
+        self._samples_ready = threading.Condition(self._lock)  # Notified once _notify_at is reached
+        self._notify_at: int = 0  # Sample count the current waiter is waiting for
+        self._wakeups: int = 0  # Bumped by wake_waiters() to end waits early
+        # Preallocated recording buffers; the audio consumer copies straight into the
+        # active one. Two slots let a new recording start while the previous one is
+        # still being transcribed from the other. Samples are stored as int16 to halve
+        # memory and bandwidth; the transcriber converts back to float32 on entry.
+        capacity = config.max_recording_duration * config.sample_rate
+        self._buffers = [np.empty(capacity, dtype=np.int16) for _ in range(2)]
+        self._scratch = np.empty(config.sample_rate, dtype=np.float32)  # Quantization workspace
+        self._active_slot = 0
+        self._audio_buffer = self._buffers[self._active_slot]
+        self._num_samples: int = 0  # Write cursor into the audio buffer
+        self._buffer_full_warned = False
+        self._sum_squares: float = 0.0  # Running energy of the recording, for O(1) silence checks
+        self._peak: float = 0.0
         self._last_transcription: str = ""
         self._processed_sample_index: int = 0  # Track how many samples have been transcribed
 
     @property
     def state(self) -> RecordingState:
         """Get current state."""
-        with self._lock:
-            return self._state
+        # Single reference read: atomic under the GIL, no lock needed
+        return self._state
 
     def transition_to(self, new_state: RecordingState) -> bool:
         """
@@ -42,51 +78,91 @@ class StateManager:
             True if transition was successful, False otherwise
         """
         with self._lock:
-            # Define valid transitions
-            valid_transitions = {
-                RecordingState.IDLE: [RecordingState.RECORDING],
-                RecordingState.RECORDING: [RecordingState.PROCESSING, RecordingState.IDLE],
-                RecordingState.PROCESSING: [RecordingState.IDLE],
-            }
-
-            if new_state in valid_transitions.get(self._state, []):
-                print(f"State transition: {self._state.name} -> {new_state.name}")
+            old_state = self._state
+            allowed = new_state in self._VALID_TRANSITIONS[old_state]
+            if allowed:
                 self._state = new_state
-                return True
-            else:
-                print(f"Invalid state transition: {self._state.name} -> {new_state.name}")
-                return False
+
+        # Log outside the lock so the audio consumer never waits on logging I/O
+        if allowed:
+            logger.info("State transition: %s -> %s", old_state.name, new_state.name)
+        else:
+            logger.warning("Invalid state transition: %s -> %s", old_state.name, new_state.name)
+        return allowed
 
     def add_audio_chunk(self, chunk: np.ndarray) -> None:
         """
-        Add an audio chunk to the buffer.
+        Quantize an audio chunk to int16 and copy it into the recording buffer.
 
         Args:
-            chunk: Audio data as numpy array
+            chunk: Mono float32 audio data in [-1.0, 1.0]
         """
         with self._lock:
-            self._audio_buffer.append(chunk)
+            start = self._num_samples
+            n = min(len(chunk), self._audio_buffer.size - start)
+            if n < len(chunk) and not self._buffer_full_warned:
+                logger.warning("Max recording duration reached, dropping further audio")
+                self._buffer_full_warned = True
+            if n:
+                block = chunk[:n]
+                self._sum_squares += float(np.dot(block, block))
+                self._peak = max(self._peak, float(block.max()), -float(block.min()))
+                self._quantize_into_locked(block, start)
+            self._num_samples = start + n
+            # Wake the waiter only once its threshold is crossed, not on every block
+            if self._num_samples >= self._notify_at:
+                self._samples_ready.notify_all()
+
+    def _quantize_into_locked(self, block: np.ndarray, start: int) -> None:
+        """Scale float samples to int16 and store them at start (caller holds the lock)."""
+        step = self._scratch.size
+        for offset in range(0, len(block), step):
+            part = block[offset:offset + step]
+            scaled = self._scratch[:len(part)]
+            np.multiply(part, 32767.0, out=scaled)
+            np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            self._audio_buffer[start + offset:start + offset + len(part)] = scaled
 
     def get_audio_data(self) -> Optional[np.ndarray]:
         """
-        Get all audio data and clear the buffer.
+        Get all recorded audio.
+
+        The returned array is a view into the recording buffer and stays valid
+        until the buffer is cleared or swapped back in.
 
         Returns:
-            Concatenated audio data or None if buffer is empty
+            Recorded audio data or None if buffer is empty
         """
         with self._lock:
-            if not self._audio_buffer:
+            if self._num_samples == 0:
                 return None
 
-            audio_data = np.concatenate(self._audio_buffer)
-            self._audio_buffer.clear()
-            return audio_data
+            return self._audio_buffer[:self._num_samples]
 
     def clear_buffer(self) -> None:
         """Clear the audio buffer."""
         with self._lock:
-            self._audio_buffer.clear()
-            self._processed_sample_index = 0
+            self._reset_buffer_locked()
+
+    def swap_buffers(self) -> None:
+        """
+        Switch recording to the other buffer slot and clear it.
+
+        Views previously returned by get_audio_data() keep pointing at the finished
+        recording until the slot is swapped back in by a later recording.
+        """
+        with self._lock:
+            self._active_slot ^= 1
+            self._audio_buffer = self._buffers[self._active_slot]
+            self._reset_buffer_locked()
+
+    def _reset_buffer_locked(self) -> None:
+        """Reset the write cursor and per-recording counters (caller holds the lock)."""
+        self._num_samples = 0
+        self._processed_sample_index = 0
+        self._buffer_full_warned = False
+        self._sum_squares = 0.0
+        self._peak = 0.0
 
     def get_next_chunk(self, chunk_size_samples: int, overlap_samples: int = 0) -> Optional[np.ndarray]:
         """
@@ -98,18 +174,10 @@ class StateManager:
             overlap_samples: Number of samples to overlap with previous chunk for context
 
         Returns:
-            Audio chunk as numpy array or None if not enough new audio available
+            Audio chunk (a view into the buffer) or None if not enough new audio available
         """
         with self._lock:
-            if not self._audio_buffer:
-                return None
-
-            # Get total samples in buffer
-            total_samples = sum(len(chunk) for chunk in self._audio_buffer)
-
-            # Calculate start position (accounting for overlap)
-            start_idx = max(0, self._processed_sample_index - overlap_samples)
-            end_idx = start_idx + chunk_size_samples + overlap_samples
+            total_samples = self._num_samples
 
             # Check if we have enough new audio
             if self._processed_sample_index >= total_samples:
@@ -122,11 +190,36 @@ class StateManager:
                 # Not enough for a full chunk yet
                 return None
 
-            # Concatenate buffer and extract chunk
-            full_audio = np.concatenate(self._audio_buffer)
-            chunk = full_audio[start_idx:min(end_idx, total_samples)]
+            # Calculate start position (accounting for overlap)
+            start_idx = max(0, self._processed_sample_index - overlap_samples)
+            end_idx = start_idx + chunk_size_samples + overlap_samples
 
-            return chunk
+            return self._audio_buffer[start_idx:min(end_idx, total_samples)]
+
+    def wait_for_samples(self, min_samples: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the recording holds at least min_samples samples.
+
+        Args:
+            min_samples: Total number of recorded samples to wait for
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if enough samples are available, False on timeout or wake_waiters()
+        """
+        with self._samples_ready:
+            self._notify_at = min_samples
+            wakeups = self._wakeups
+            self._samples_ready.wait_for(
+                lambda: self._num_samples >= min_samples or self._wakeups != wakeups, timeout
+            )
+            return self._num_samples >= min_samples
+
+    def wake_waiters(self) -> None:
+        """Make any pending wait_for_samples() call return now (e.g. when recording stops)."""
+        with self._samples_ready:
+            self._wakeups += 1
+            self._samples_ready.notify_all()
 
     def mark_chunk_processed(self, num_samples: int) -> None:
         """
@@ -146,23 +239,16 @@ class StateManager:
             overlap_samples: Number of samples to include before the unprocessed section
 
         Returns:
-            Remaining audio as numpy array or None if no unprocessed audio
+            Remaining audio (a view into the buffer) or None if no unprocessed audio
         """
         with self._lock:
-            if not self._audio_buffer:
-                return None
-
-            total_samples = sum(len(chunk) for chunk in self._audio_buffer)
-
             # If everything is processed, return None
-            if self._processed_sample_index >= total_samples:
+            if self._processed_sample_index >= self._num_samples:
                 return None
 
             # Get from (processed_index - overlap) to end
             start_idx = max(0, self._processed_sample_index - overlap_samples)
-            full_audio = np.concatenate(self._audio_buffer)
-
-            return full_audio[start_idx:]
+            return self._audio_buffer[start_idx:self._num_samples]
 
     def get_total_samples(self) -> int:
         """
@@ -171,10 +257,24 @@ class StateManager:
         Returns:
             Total sample count
         """
+        return self._num_samples
+
+    def get_recording_stats(self) -> RecordingStats:
+        """
+        Get sample count, duration, RMS and peak of the recording in one call.
+
+        Returns:
+            Stats accumulated while recording (no pass over the audio)
+        """
         with self._lock:
-            if not self._audio_buffer:
-                return 0
-            return sum(len(chunk) for chunk in self._audio_buffer)
+            n = self._num_samples
+            rms = float(np.sqrt(self._sum_squares / n)) if n else 0.0
+            return RecordingStats(
+                num_samples=n,
+                duration=n / config.sample_rate,
+                rms=rms,
+                peak=self._peak,
+            )
 
     def get_processed_samples(self) -> int:
         """
@@ -183,25 +283,19 @@ class StateManager:
         Returns:
             Processed sample count
         """
-        with self._lock:
-            return self._processed_sample_index
-
-    def reset_chunk_tracking(self) -> None:
-        """Reset chunk processing tracking (call when starting new recording)."""
-        with self._lock:
-            self._processed_sample_index = 0
+        return self._processed_sample_index
 
     def is_idle(self) -> bool:
         """Check if state is IDLE."""
-        return self.state == RecordingState.IDLE
+        return self._state is RecordingState.IDLE
 
     def is_recording(self) -> bool:
         """Check if state is RECORDING."""
-        return self.state == RecordingState.RECORDING
+        return self._state is RecordingState.RECORDING
 
     def is_processing(self) -> bool:
         """Check if state is PROCESSING."""
-        return self.state == RecordingState.PROCESSING
+        return self._state is RecordingState.PROCESSING
 
     def set_last_transcription(self, text: str) -> None:
         """
@@ -220,8 +314,7 @@ class StateManager:
         Returns:
             The last transcribed text
         """
-        with self._lock:
-            return self._last_transcription
+        return self._last_transcription
 
     def clear_transcription(self) -> None:
         """Clear the last transcription."""
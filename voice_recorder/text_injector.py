@@ -1,10 +1,22 @@
 """Text injection via clipboard and keyboard simulation."""
 
+import logging
 import time
+from enum import Enum, auto
 import pyperclip
 from pynput.keyboard import Controller, Key
 from .config import config
 
+logger = logging.getLogger(__name__)
+
+
+class PasteResult(Enum):
+    """Outcome of TextInjector.paste_text."""
+
+    PASTED = auto()  # Pasted into the active application
+    COPIED = auto()  # On the clipboard, but the paste keystroke failed
+    FAILED = auto()  # Not on the clipboard either
+
 
 class TextInjector:
     """Injects text into the active application via clipboard."""
@@ -13,57 +25,69 @@ class TextInjector:
         """Initialize text injector."""
         self.keyboard = Controller()
 
-    def paste_text(self, text: str) -> bool:
+    def paste_text(self, text: str) -> PasteResult:
         """
         Paste text into the active application.
 
+        The text is copied to the clipboard first, so if the paste keystroke fails
+        it is already there for the user to paste manually.
+
         Args:
             text: Text to paste
 
         Returns:
-            True if successful, False otherwise
+            Whether the text was pasted, only copied, or neither
         """
         if not text:
-            print("No text to paste")
-            return False
+            logger.warning("No text to paste")
+            return PasteResult.FAILED
+
+        # Save current clipboard content if configured
+        original_clipboard = None
+        if config.restore_clipboard:
+            try:
+                original_clipboard = pyperclip.paste()
+            except Exception as e:
+                logger.warning("Could not save clipboard: %s", e)
+
+        if not self.copy_to_clipboard_only(text):
+            return PasteResult.FAILED
+
+        if not self.send_paste_keystroke():
+            return PasteResult.COPIED
+
+        # Restore original clipboard if configured
+        if config.restore_clipboard and original_clipboard is not None:
+            # Wait a bit before restoring
+            time.sleep(0.2)
+            try:
+                pyperclip.copy(original_clipboard)
+                logger.info("Restored original clipboard")
+            except Exception as e:
+                logger.warning("Could not restore clipboard: %s", e)
+
+        return PasteResult.PASTED
+
+    def send_paste_keystroke(self) -> bool:
+        """
+        Simulate Cmd+V in the active application.
 
+        Returns:
+            True if successful, False otherwise
+        """
         try:
-            # Save current clipboard content if configured
-            original_clipboard = None
-            if config.restore_clipboard:
-                try:
-                    original_clipboard = pyperclip.paste()
-                except Exception as e:
-                    print(f"Warning: Could not save clipboard: {e}")
-
-            # Copy text to clipboard
-            pyperclip.copy(text)
-            print(f"Copied {len(text)} characters to clipboard")
-
             # Wait a bit for clipboard to update
             time.sleep(config.paste_delay_ms / 1000.0)
 
-            # Simulate Cmd+V to paste
             with self.keyboard.pressed(Key.cmd):
                 self.keyboard.press("v")
                 self.keyboard.release("v")
 
-            print("Pasted text to active application")
-
-            # Restore original clipboard if configured
-            if config.restore_clipboard and original_clipboard is not None:
-                # Wait a bit before restoring
-                time.sleep(0.2)
-                try:
-                    pyperclip.copy(original_clipboard)
-                    print("Restored original clipboard")
-                except Exception as e:
-                    print(f"Warning: Could not restore clipboard: {e}")
-
+            logger.info("Pasted text to active application")
             return True
 
         except Exception as e:
-            print(f"Error pasting text: {e}")
+            logger.error("Error pasting text: %s", e)
             return False
 
     def copy_to_clipboard_only(self, text: str) -> bool:
@@ -81,8 +105,8 @@ class TextInjector:
 
         try:
             pyperclip.copy(text)
-            print(f"Copied {len(text)} characters to clipboard")
+            logger.info("Copied %d characters to clipboard", len(text))
             return True
         except Exception as e:
-            print(f"Error copying to clipboard: {e}")
+            logger.error("Error copying to clipboard: %s", e)
             return False
@@ -1,14 +1,25 @@
 """Speech-to-text transcription using Whisper."""
 
+import ctranslate2
+import functools
+import logging
 import numpy as np
 import os
-import tempfile
-import wave
-from pathlib import Path
 from typing import Optional, Callable
 from faster_whisper import WhisperModel
 from .config import config
 
+logger = logging.getLogger(__name__)
+
+_MIN_VAD_SECONDS = 2.0  # Chunks shorter than this skip the Silero VAD pass
+
+# int8 weights first; the mixed variants use bf16/fp16 for the non-GEMM layers where
+# the hardware has fast paths for them (AVX512-BF16/AMX on CPU, tensor cores on GPU)
+_COMPUTE_TYPE_PREFERENCE = {
+    "cpu": ("int8_bfloat16", "int8", "float32"),
+    "cuda": ("int8_float16", "int8_bfloat16", "float16", "int8", "float32"),
+}
+
 
 class Transcriber:
     """Transcribes audio to text using Whisper."""
@@ -17,24 +28,27 @@ class Transcriber:
         """Initialize transcriber (model loaded lazily)."""
         self.model: Optional[WhisperModel] = None
         self._model_loaded = False
-        self._temp_files: list[Path] = []  # Track temp files for cleanup
+        self._prompt_cache: tuple[str, list[int]] = ("", [])  # Last prompt and its token ids
 
     def _load_model(self) -> None:
         """Load the Whisper model."""
         if self._model_loaded:
             return
 
-        print(f"Loading Whisper model: {config.whisper_model}...")
+        device = _select_device(config.whisper_device)
+        compute_type = config.whisper_compute_type or _select_compute_type(device)
+        cpu_threads = config.whisper_cpu_threads or max(1, (os.cpu_count() or 2) // 2)
+
+        # Prefer a model pre-quantized by scripts/quantize_model.py
+        quantized_dir = config.model_cache_dir / f"{config.whisper_model}-int8"
+        model_path = str(quantized_dir) if (quantized_dir / "model.bin").exists() else config.whisper_model
+
         try:
-            self.model = WhisperModel(
-                config.whisper_model,
-                device=config.whisper_device,
-                compute_type="int8" if config.whisper_device == "cpu" else "float16",
-            )
+            self.model = _get_whisper_model(model_path, device, compute_type, cpu_threads)
             self._model_loaded = True
-            print("Model loaded successfully")
+            logger.info("Model loaded successfully")
         except Exception as e:
-            print(f"Error loading Whisper model: {e}")
+            logger.error("Error loading Whisper model: %s", e)
             raise
 
     def transcribe(self, audio_data: np.ndarray) -> str:
@@ -42,7 +56,7 @@ class Transcriber:
         Transcribe audio data to text.
 
         Args:
-            audio_data: Audio samples as numpy array (float32, mono, 16kHz)
+            audio_data: Audio samples as numpy array (int16 or float, mono, 16kHz)
 
         Returns:
             Transcribed text
@@ -53,11 +67,9 @@ class Transcriber:
         if self.model is None:
             raise RuntimeError("Whisper model not loaded")
 
-        # Ensure audio is in the correct format
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
+        audio_data = _to_float32(audio_data)
 
-        print(f"Transcribing {len(audio_data) / config.sample_rate:.2f}s of audio...")
+        logger.info("Transcribing %.2fs of audio...", len(audio_data) / config.sample_rate)
 
         try:
             # Transcribe
@@ -79,16 +91,55 @@ class Transcriber:
             transcribed_text = " ".join(text_parts).strip()
 
             if transcribed_text:
-                print(f"Transcription complete: {len(transcribed_text)} characters")
+                logger.info("Transcription complete: %d characters", len(transcribed_text))
             else:
-                print("No speech detected in audio")
+                logger.info("No speech detected in audio")
 
             return transcribed_text
 
         except Exception as e:
-            print(f"Error during transcription: {e}")
+            logger.error("Error during transcription: %s", e)
             raise
 
+    def warmup(self) -> None:
+        """
+        Load the model and run one short decode so the first real transcription
+        doesn't pay for CTranslate2's kernel and thread-pool setup.
+        """
+        if not self._model_loaded:
+            self._load_model()
+
+        if self.model is None:
+            raise RuntimeError("Whisper model not loaded")
+
+        silent = np.zeros(config.sample_rate // 2, dtype=np.float32)
+        segments, _ = self.model.transcribe(silent, language="en", beam_size=1, vad_filter=False)
+        # Segments are generated lazily; consume them so the decode actually runs
+        for _ in segments:
+            pass
+
+    def _prompt_tokens(self, context: str) -> list[int] | str:
+        """
+        Tokenize a prompt the way faster-whisper would, reusing the last result.
+
+        Args:
+            context: Prompt text
+
+        Returns:
+            Token ids, or the text itself if the model exposes no tokenizer
+        """
+        cached_context, cached_tokens = self._prompt_cache
+        if context == cached_context:
+            return cached_tokens
+
+        tokenizer = getattr(self.model, "hf_tokenizer", None)
+        if tokenizer is None:
+            return context
+
+        tokens = tokenizer.encode(" " + context, add_special_tokens=False).ids
+        self._prompt_cache = (context, tokens)
+        return tokens
+
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
         return self._model_loaded
@@ -98,14 +149,20 @@ class Transcriber:
         audio_data: np.ndarray,
         previous_text: str = "",
         progress_callback: Optional[Callable[[str], None]] = None,
+        beam_size: int = 1,
     ) -> str:
         """
         Transcribe an audio chunk with context from previous transcriptions.
 
+        Defaults to greedy decoding without temperature fallback, which keeps live
+        chunks fast; pass a larger beam_size for a final pass where accuracy matters
+        more than latency (that pass uses faster-whisper's default decoding options).
+
         Args:
-            audio_data: Audio samples as numpy array (float32, mono, 16kHz)
+            audio_data: Audio samples as numpy array (int16 or float, mono, 16kHz)
             previous_text: Previous transcription text to use as context
             progress_callback: Optional callback for progress updates
+            beam_size: Beam width for decoding (1 = greedy)
 
         Returns:
             Transcribed text for this chunk
@@ -116,9 +173,7 @@ class Transcriber:
         if self.model is None:
             raise RuntimeError("Whisper model not loaded")
 
-        # Ensure audio is in the correct format
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
+        audio_data = _to_float32(audio_data)
 
         duration_seconds = len(audio_data) / config.sample_rate
 
@@ -130,19 +185,35 @@ class Transcriber:
             transcribe_params = {
                 "audio": audio_data,
                 "language": "en",
-                "beam_size": 5,
-                "vad_filter": True,
-                "vad_parameters": dict(
-                    min_silence_duration_ms=500,  # Default for chunking
-                ),
+                "beam_size": beam_size,
             }
 
+            # Live chunks trade faithfulness for latency; the final beam-search pass keeps
+            # faster-whisper's defaults, including the temperature fallback schedule
+            if beam_size == 1:
+                transcribe_params.update(
+                    best_of=1,
+                    temperature=0.0,  # No temperature fallback retries
+                    condition_on_previous_text=False,  # Context comes from initial_prompt
+                    without_timestamps=True,  # Only the text is used
+                )
+
+            # On short chunks the VAD model's fixed cost outweighs the silence it could trim
+            if duration_seconds >= _MIN_VAD_SECONDS:
+                transcribe_params["vad_filter"] = True
+                transcribe_params["vad_parameters"] = dict(
+                    min_silence_duration_ms=500,  # Default for chunking
+                )
+
             # Use previous text as initial prompt for context (last ~100 chars)
             if previous_text:
-                # Take last sentence or last 100 chars as context
-                context = previous_text[-100:].strip()
+                context = previous_text[-100:]
+                if len(previous_text) > 100:
+                    # Don't start the prompt on a partial word
+                    context = context.partition(" ")[2]
+                context = context.strip()
                 if context:
-                    transcribe_params["initial_prompt"] = context
+                    transcribe_params["initial_prompt"] = self._prompt_tokens(context)
 
             # Transcribe
             segments, info = self.model.transcribe(**transcribe_params)
@@ -166,55 +237,92 @@ class Transcriber:
             error_msg = f"Error transcribing chunk: {e}"
             if progress_callback:
                 progress_callback(error_msg)
-            print(error_msg)
+            logger.error(error_msg)
             raise
 
-    def _write_chunk_to_temp_file(self, audio_data: np.ndarray, chunk_index: int) -> Path:
-        """
-        Write audio chunk to a temporary WAV file.
 
-        Args:
-            audio_data: Audio samples as numpy array (float32, mono, 16kHz)
-            chunk_index: Index of the chunk for file naming
-
-        Returns:
-            Path to the temporary file
-        """
-        # Ensure temp directory exists
-        config.temp_audio_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create temp file with unique name
-        temp_file = config.temp_audio_dir / f"chunk_{chunk_index}_{os.getpid()}.wav"
-
-        # Convert float32 to int16 for WAV format
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-
-        # Write WAV file
-        with wave.open(str(temp_file), "wb") as wav_file:
-            wav_file.setnchannels(config.channels)
-            wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-            wav_file.setframerate(config.sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
-
-        # Track for cleanup
-        self._temp_files.append(temp_file)
-
-        return temp_file
-
-    def cleanup_temp_files(self) -> None:
-        """Remove all temporary audio files created during chunked transcription."""
-        for temp_file in self._temp_files:
-            try:
-                if temp_file.exists():
-                    temp_file.unlink()
-            except Exception as e:
-                print(f"Warning: Failed to delete temp file {temp_file}: {e}")
-
-        self._temp_files.clear()
-
-        # Try to remove temp directory if empty
-        try:
-            if config.temp_audio_dir.exists() and not any(config.temp_audio_dir.iterdir()):
-                config.temp_audio_dir.rmdir()
-        except Exception:
-            pass  # Directory not empty or other issue, ignore
+def _select_device(requested: str) -> str:
+    """
+    Resolve the configured Whisper device.
+
+    Args:
+        requested: "auto", "cpu" or "cuda"
+
+    Returns:
+        "cuda" if requested, or if auto and a CUDA GPU is visible; otherwise "cpu"
+    """
+    if requested != "auto":
+        return requested
+
+    # CTranslate2 has no Metal backend, so Apple GPUs can't be used here
+    try:
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda"
+    except Exception as e:
+        logger.warning("Could not query CUDA devices: %s", e)
+    return "cpu"
+
+
+def _select_compute_type(device: str) -> str:
+    """
+    Pick the fastest compute type the device supports.
+
+    Args:
+        device: Device to run on ("cpu" or "cuda")
+
+    Returns:
+        CTranslate2 compute type
+    """
+    try:
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception as e:
+        logger.warning("Could not query supported compute types for %s: %s", device, e)
+        return "int8" if device == "cpu" else "int8_float16"
+
+    for compute_type in _COMPUTE_TYPE_PREFERENCE.get(device, ("int8", "float32")):
+        if compute_type in supported:
+            return compute_type
+    return "default"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_whisper_model(model_name: str, device: str, compute_type: str, cpu_threads: int) -> WhisperModel:
+    """
+    Load a Whisper model, shared by every Transcriber with the same settings.
+
+    Args:
+        model_name: Whisper model name or path
+        device: Device to run on ("cpu" or "cuda")
+        compute_type: CTranslate2 compute type
+        cpu_threads: Number of CPU threads for inference
+
+    Returns:
+        Loaded model
+    """
+    logger.info("Loading Whisper model: %s (%s)...", model_name, compute_type)
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1,  # One utterance at a time
+    )
+
+
+def _to_float32(audio_data: np.ndarray) -> np.ndarray:
+    """
+    Convert audio to the contiguous float32 [-1.0, 1.0] format Whisper expects.
+
+    Recordings arrive as int16 views of the StateManager buffer and are scaled in
+    one pass. Contiguous float32 input is passed through without a copy; other float
+    input (e.g. float64 from soundfile.read) is converted.
+
+    Args:
+        audio_data: int16 or floating-point audio samples
+
+    Returns:
+        float32 audio samples
+    """
+    if audio_data.dtype == np.int16:
+        return np.multiply(audio_data, 1.0 / 32768.0, dtype=np.float32)
+    return np.ascontiguousarray(audio_data, dtype=np.float32)
@@ -3,27 +3,74 @@ Tkinter UI for Voice Recorder.
 Provides a simple window for recording and displaying transcriptions.
 """
 
-import queue
+import collections
+import os
+import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import scrolledtext
-from typing import Callable
+from typing import Callable, Optional
 import pyperclip
 
+_PROGRESS_INTERVAL = 0.05  # Render progress at most every 50ms
+_POLL_INTERVAL_MS = 100  # Queue poll period where Tk has no file handlers (Windows)
+_PROGRESS_FMT = "Transcribed {:d}:{:02d} / {:d}:{:02d} ({:d}%)"
+
+# Keys the read-only text display still accepts
+_TEXT_NAVIGATION_KEYS = frozenset({"Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next"})
+_COPY_MODIFIER_MASK = 0x4 | 0x8  # Control, and Command (Mod1) on macOS
+_SHIFT_MASK = 0x1
+_TAB_KEYS = frozenset({"Tab", "ISO_Left_Tab"})  # ISO_Left_Tab is Shift-Tab on X11
+
+# Queued event type -> (state, transcription, status, status_color) for that payload.
+# Payloads are tuples so producers don't allocate a dict per update.
+_EVENT_FIELDS = {
+    "batch": lambda d: d,
+    "status": lambda d: (None, None, d[0], d[1]),
+}
+
 
 class VoiceRecorderUI:
     """Simple Tkinter UI for voice recording and transcription display."""
 
-    def __init__(self, on_record_pressed: Callable[[], None], on_clear_pressed: Callable[[], None]):
+    def __init__(
+        self,
+        on_record_pressed: Callable[[], None],
+        on_clear_pressed: Callable[[], None],
+        shutdown_event: Optional[threading.Event] = None,
+    ):
         """
         Initialize the UI.
 
         Args:
             on_record_pressed: Callback function when record button is pressed
             on_clear_pressed: Callback function when clear button is pressed
+            shutdown_event: When set (e.g. from a signal handler), the main loop exits
         """
         self.on_record_pressed = on_record_pressed
         self.on_clear_pressed = on_clear_pressed
-        self.update_queue: queue.Queue = queue.Queue()
+        self.shutdown_event = shutdown_event
+        # Single consumer (the Tk thread): deque append/popleft are atomic without a lock
+        self.update_queue: collections.deque = collections.deque()
+
+        # Progress is coalesced: producers overwrite a single slot and only the latest
+        # value is rendered, at most once per _PROGRESS_INTERVAL
+        self._pending_progress: Optional[tuple[float, float]] = None
+        self._last_progress_render = 0.0
+        self._progress_after_id: Optional[str] = None
+
+        # What the widgets currently show, so repeated updates can be skipped
+        self._displayed_text = ""
+        self._text_buttons_enabled = False
+        self._current_state = "IDLE"  # The widgets are created in their IDLE look
+        self._progress_text = ""
+        self._status_reset_id: Optional[str] = None  # Pending "back to Ready" timer
+        self._hidden = False  # Window minimized or withdrawn, tracked from <Map>/<Unmap>
+        self._deferred_batch: Optional[dict] = None  # Merged updates held while the window is hidden
+
+        # Clipboard writes can fork a helper process (pbcopy/xclip); keep them off the Tk thread
+        self._clipboard_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clipboard")
 
         # Create main window
         self.root = tk.Tk()
@@ -34,8 +81,24 @@ class VoiceRecorderUI:
         # Create UI components
         self._create_widgets()
 
-        # Start queue checking
-        self._check_queue()
+        # Self-pipe: producers write a byte after queueing so Tk wakes up only when
+        # there is something to apply, instead of polling the queue on a timer.
+        # Tk on Windows has no file handlers, so it falls back to polling there.
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        if hasattr(self.root.tk, "createfilehandler"):
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+            self.root.tk.createfilehandler(self._wake_r, tk.READABLE, self._drain_queue)
+        else:
+            self._poll_queue()
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
+
+        # Poll for shutdown requests
+        if self.shutdown_event is not None:
+            self._check_shutdown()
 
     def _create_widgets(self):
         """Create all UI widgets."""
@@ -57,6 +120,12 @@ class VoiceRecorderUI:
         )
         self.progress_label.pack(pady=(0, 5))
 
+        # Hot-path label updates call the Tcl "configure" command directly, skipping
+        # Misc.configure's option-dict handling
+        self._tk_call = self.root.tk.call
+        self._status_label_path = str(self.status_label)
+        self._progress_label_path = str(self.progress_label)
+
         # Text display area (scrollable, read-only)
         text_frame = tk.Frame(self.root)
         text_frame.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
@@ -65,11 +134,16 @@ class VoiceRecorderUI:
             text_frame,
             wrap=tk.WORD,
             font=("Arial", 11),
-            state=tk.DISABLED,
-            height=15
+            height=15,
+            insertwidth=0  # No blinking insert cursor in a read-only display
         )
         self.text_display.pack(fill=tk.BOTH, expand=True)
 
+        # Read-only for the user, but left NORMAL so updates don't have to toggle state
+        self.text_display.bind("<Key>", self._on_text_key)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.text_display.bind(sequence, lambda e: "break")
+
         # Button frame
         button_frame = tk.Frame(self.root)
         button_frame.pack(pady=10)
@@ -109,112 +183,267 @@ class VoiceRecorderUI:
         )
         self.clear_button.pack(side=tk.LEFT, padx=5)
 
+    def _on_text_key(self, event: tk.Event) -> Optional[str]:
+        """Block typing in the text display while keeping copy, select-all, navigation and Tab traversal."""
+        if event.keysym in _TEXT_NAVIGATION_KEYS:
+            return None
+        if event.keysym in _TAB_KEYS:
+            # The Text class binding would insert a tab; move focus like other widgets do
+            backwards = event.keysym == "ISO_Left_Tab" or event.state & _SHIFT_MASK
+            target = self.text_display.tk_focusPrev() if backwards else self.text_display.tk_focusNext()
+            if target is not None:
+                target.focus_set()
+            return "break"
+        if event.state & _COPY_MODIFIER_MASK and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
+
     def _on_record_clicked(self):
         """Handle record button click."""
         self.on_record_pressed()
 
     def _on_copy_clicked(self):
         """Copy displayed text to clipboard."""
-        text = self.text_display.get("1.0", tk.END).strip()
+        # The widget is read-only, so the last text set is exactly what it shows
+        text = self._displayed_text.strip()
         if text:
-            pyperclip.copy(text)
-            self._update_status("Copied to clipboard!", "green")
-            # Reset status after 2 seconds
-            self.root.after(2000, lambda: self._update_status("Ready", "gray"))
+            future = self._clipboard_executor.submit(pyperclip.copy, text)
+            future.add_done_callback(self._on_copy_done)
+            self._schedule_status_reset()
+
+    def _on_copy_done(self, future: Future):
+        """Report the result of a background clipboard copy (runs on the executor thread)."""
+        error = future.exception()
+        if error is None:
+            self.queue_status_update("Copied to clipboard!", "green")
+        else:
+            self.queue_status_update(f"Copy failed: {error}", "red")
 
     def _on_clear_clicked(self):
         """Clear the displayed transcription."""
         self.on_clear_pressed()
         self._update_status("Text cleared", "green")
-        # Reset status after 2 seconds
-        self.root.after(2000, lambda: self._update_status("Ready", "gray"))
-
-    def _check_queue(self):
-        """Check queue for updates from other threads."""
+        self._schedule_status_reset()
+
+    def _schedule_status_reset(self):
+        """Reset status to "Ready" after 2 seconds, replacing any reset already pending."""
+        self._cancel_status_reset()
+        self._status_reset_id = self.root.after(2000, self._reset_status_ready)
+
+    def _cancel_status_reset(self):
+        """Drop a pending status reset, if any."""
+        if self._status_reset_id is not None:
+            self.root.after_cancel(self._status_reset_id)
+            self._status_reset_id = None
+
+    def _reset_status_ready(self):
+        """Show the idle "Ready" status."""
+        self._status_reset_id = None
+        self._update_status("Ready", "gray")
+
+    def _wake(self):
+        """Wake the Tk thread to drain the update queue (called after every put)."""
+        if self._wake_w is None:
+            return  # Polling instead
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass  # Pipe full: a wakeup is already pending
+
+    def _poll_queue(self):
+        """Drain the update queue on a timer (where Tk has no file handlers)."""
+        self._drain_queue(None, 0)
+        self.root.after(_POLL_INTERVAL_MS, self._poll_queue)
+
+    def _drain_queue(self, fd: Optional[int], mask: int):
+        """Apply all queued updates from other threads (Tk file handler)."""
+        # Empty the pipe before the queue so a put racing with this drain re-arms the handler
+        if fd is not None:
+            try:
+                while os.read(fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+        # Fold everything queued since the last drain into one update, keeping only the
+        # latest value of each kind, so a burst costs one round of widget changes
+        merged = self._deferred_batch or {
+            "state": None, "transcription": None, "status": None, "status_color": "gray",
+        }
         try:
             while True:
-                event_type, data = self.update_queue.get_nowait()
-
-                if event_type == "state":
-                    self._update_state(data)
-                elif event_type == "transcription":
-                    self._update_transcription(data)
-                elif event_type == "status":
-                    self._update_status(data["message"], data.get("color", "gray"))
-                elif event_type == "progress":
-                    self._update_progress(data["processed"], data["total"])
-
-        except queue.Empty:
+                event_type, data = self.update_queue.popleft()
+
+                fields = _EVENT_FIELDS.get(event_type)
+                if fields is None:
+                    continue
+                state, transcription, status, status_color = fields(data)
+
+                if state is not None:
+                    merged["state"] = state
+                    merged["status"] = None  # A state change sets its own status text
+                if transcription is not None:
+                    merged["transcription"] = transcription
+                if status is not None:
+                    merged["status"], merged["status_color"] = status, status_color
+
+        except IndexError:
             pass
 
-        # Schedule next check
-        self.root.after(100, self._check_queue)
+        # Nothing is painted while minimized: keep merging and apply on the next <Map>
+        if self._hidden:
+            self._deferred_batch = merged
+            return
+        self._deferred_batch = None
+
+        self._apply_batch(merged)
+        self._flush_progress()
+
+        # Let Tk lay out and redraw the whole batch in a single pass
+        self.root.update_idletasks()
+
+    def _on_map(self, event: tk.Event):
+        """Apply the updates deferred while the window was hidden."""
+        # Child widgets' <Map> events also reach the root's bindings
+        if event.widget is self.root:
+            self._hidden = False
+            self._drain_queue(self._wake_r, tk.READABLE)
+
+    def _on_unmap(self, event: tk.Event):
+        """Start deferring updates once the window is minimized or withdrawn."""
+        if event.widget is self.root:
+            self._hidden = True
+
+    def _flush_progress(self):
+        """Render the latest pending progress, deferring it if one was shown too recently."""
+        if self._pending_progress is None:
+            return
+
+        delay = self._last_progress_render + _PROGRESS_INTERVAL - time.monotonic()
+        if delay > 0:
+            if self._progress_after_id is None:
+                self._progress_after_id = self.root.after(int(delay * 1000) + 1, self._on_progress_timer)
+            return
+
+        if self._progress_after_id is not None:
+            self.root.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
+
+        processed_seconds, total_seconds = self._pending_progress
+        self._pending_progress = None
+        self._last_progress_render = time.monotonic()
+        self._update_progress(processed_seconds, total_seconds)
+
+    def _on_progress_timer(self):
+        """Deferred progress render."""
+        self._progress_after_id = None
+        self._flush_progress()
+
+    def _apply_batch(self, data: dict):
+        """Apply a batched update; state goes first so a status message isn't overwritten by it."""
+        if data["state"] is not None:
+            self._update_state(data["state"])
+        if data["transcription"] is not None:
+            self._update_transcription(data["transcription"])
+        if data["status"] is not None:
+            self._update_status(data["status"], data["status_color"])
+
+    def _check_shutdown(self):
+        """Exit the main loop once a shutdown has been requested."""
+        if self.shutdown_event.is_set():
+            self.root.quit()
+            return
+
+        self.root.after(100, self._check_shutdown)
 
     def _update_state(self, state: str):
         """Update UI based on recording state."""
+        if state in ("IDLE", "RECORDING"):
+            # Progress from the previous phase must not reappear after being cleared
+            self._pending_progress = None
+
+        if state == self._current_state:
+            return
+        self._current_state = state
+
+        # A new state sets its own status; a pending "Ready" must not overwrite it
+        self._cancel_status_reset()
+
         if state == "IDLE":
             self.record_button.config(text="🎤 Record", state=tk.NORMAL)
             self.status_label.config(text="Ready", fg="gray")
-            self.progress_label.config(text="")  # Hide progress
+            self._set_progress_text("")  # Hide progress
         elif state == "RECORDING":
             self.record_button.config(text="⏹️ Stop Recording", state=tk.NORMAL)
             self.status_label.config(text="Recording...", fg="red")
-            self.progress_label.config(text="")  # Clear progress at start
+            self._set_progress_text("")  # Clear progress at start
         elif state == "PROCESSING":
             self.record_button.config(text="⏳ Processing...", state=tk.DISABLED)
             self.status_label.config(text="Transcribing...", fg="orange")
 
     def _update_transcription(self, text: str):
         """Update the text display with transcription."""
-        self.text_display.config(state=tk.NORMAL)
-        self.text_display.delete("1.0", tk.END)
-        self.text_display.insert("1.0", text)
-        self.text_display.config(state=tk.DISABLED)
+        if text == self._displayed_text:
+            return
+        previous_text = self._displayed_text
+        self._displayed_text = text
+
+        if previous_text and text.startswith(previous_text):
+            # Chunked transcription only ever appends: insert just the new tail
+            self.text_display.insert(tk.END, text[len(previous_text):])
+        else:
+            self.text_display.delete("1.0", tk.END)
+            self.text_display.insert("1.0", text)
 
         # Enable copy and clear buttons if there's text
-        if text.strip():
-            self.copy_button.config(state=tk.NORMAL)
-            self.clear_button.config(state=tk.NORMAL)
-        else:
-            self.copy_button.config(state=tk.DISABLED)
-            self.clear_button.config(state=tk.DISABLED)
+        enabled = bool(text.strip())
+        if enabled != self._text_buttons_enabled:
+            self._text_buttons_enabled = enabled
+            button_state = tk.NORMAL if enabled else tk.DISABLED
+            self.copy_button.config(state=button_state)
+            self.clear_button.config(state=button_state)
 
     def _update_status(self, message: str, color: str = "gray"):
         """Update status label."""
-        self.status_label.config(text=message, fg=color)
+        self._tk_call(self._status_label_path, "configure", "-text", message, "-fg", color)
 
     def _update_progress(self, processed_seconds: float, total_seconds: float):
         """Update progress display."""
-        def format_time(seconds: float) -> str:
-            """Format seconds as MM:SS."""
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{minutes}:{secs:02d}"
+        processed_min, processed_sec = divmod(int(processed_seconds), 60)
+        total_min, total_sec = divmod(int(total_seconds), 60)
+        percentage = round(processed_seconds * 100 / total_seconds) if total_seconds > 0 else 0
 
-        processed_str = format_time(processed_seconds)
-        total_str = format_time(total_seconds)
-
-        # Calculate percentage
-        percentage = (processed_seconds / total_seconds * 100) if total_seconds > 0 else 0
-
-        progress_text = f"Transcribed {processed_str} / {total_str} ({percentage:.0f}%)"
-        self.progress_label.config(text=progress_text)
-
-    def queue_state_update(self, state: str):
-        """Queue a state update (thread-safe)."""
-        self.update_queue.put(("state", state))
+        self._set_progress_text(
+            _PROGRESS_FMT.format(processed_min, processed_sec, total_min, total_sec, percentage)
+        )
 
-    def queue_transcription_update(self, text: str):
-        """Queue a transcription update (thread-safe)."""
-        self.update_queue.put(("transcription", text))
+    def _set_progress_text(self, text: str):
+        """Set the progress label, skipping the Tk call if the text is unchanged."""
+        if text == self._progress_text:
+            return
+        self._progress_text = text
+        self._tk_call(self._progress_label_path, "configure", "-text", text)
+
+    def queue_update(
+        self,
+        state: Optional[str] = None,
+        status: Optional[str] = None,
+        status_color: str = "gray",
+        transcription: Optional[str] = None,
+    ):
+        """Queue several UI changes as one event (thread-safe)."""
+        self.update_queue.append(("batch", (state, transcription, status, status_color)))
+        self._wake()
 
     def queue_status_update(self, message: str, color: str = "gray"):
         """Queue a status update (thread-safe)."""
-        self.update_queue.put(("status", {"message": message, "color": color}))
+        self.update_queue.append(("status", (message, color)))
+        self._wake()
 
     def queue_progress_update(self, processed_seconds: float, total_seconds: float):
-        """Queue a progress update (thread-safe)."""
-        self.update_queue.put(("progress", {"processed": processed_seconds, "total": total_seconds}))
+        """Queue a progress update (thread-safe); replaces any progress not yet rendered."""
+        self._pending_progress = (processed_seconds, total_seconds)
+        self._wake()
 
     def show(self):
         """Start the UI main loop (blocking)."""
@@ -222,6 +451,12 @@ class VoiceRecorderUI:
 
     def destroy(self):
         """Destroy the UI window."""
-        if self.root:
+        self._clipboard_executor.shutdown(wait=False)
+        try:
+            if self._wake_r is not None:
+                self.root.tk.deletefilehandler(self._wake_r)
             self.root.quit()
             self.root.destroy()
+        except tk.TclError:
+            pass  # Already destroyed (window closed, or destroy() called twice)
+        # The pipe stays open: worker threads may still queue (and wake) during shutdown